@@ -1,16 +1,14 @@
 #!/usr/bin/env python3
-import os, time, json, threading, ssl, smtplib, serial, certifi
+import os, time, select, signal, threading, ssl, smtplib, serial, certifi
+import numpy as np
+import orjson
 from collections import deque
 from email.mime.text import MIMEText
 from datetime import datetime
-import matplotlib
 from serial.serialutil import SerialException
 from dotenv import load_dotenv
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-
-# matplotlib.use("TkAgg")
-matplotlib.use("MacOSX")
+import pyqtgraph as pg
+from pyqtgraph.Qt import QtCore
 
 # ====== .env ======
 load_dotenv()
@@ -21,7 +19,12 @@ FROM_EMAIL = os.getenv("FROM_EMAIL")
 TO_EMAIL = os.getenv("TO_EMAIL", FROM_EMAIL)
 APP_PASS = os.getenv("APP_PASS")
 READ_TIMEOUT = 1
+SMTP_IDLE_S = 100  # reconnect rather than reuse an SMTP session idle this long
 WINDOW_SEC = int(os.getenv("WINDOW_SEC", "300"))
+MAX_PLOT_POINTS = int(os.getenv("MAX_PLOT_POINTS", "500"))
+PRINT_PERIOD_S = 0.5
+ALERT_HISTORY_LEN = 1000
+MAX_SERIAL_BUF = 4096  # bytes of unframed serial output kept while waiting for "}"
 
 # ====== ALERT THRESHOLDS ======
 ALERT_THRESHOLDS = {
@@ -35,60 +38,145 @@ ALERT_THRESHOLDS = {
     "humidity_low": 20
 }
 
+# Threshold lanes evaluated by check_alerts in one vector comparison. Missing
+# or null readings become NaN, which never compares true.
+ALERT_KEYS = ("gas", "sound", "water", "vibration", "temp", "humidity", "motion")
+ALERT_HI = np.array([
+    ALERT_THRESHOLDS['gas'],
+    ALERT_THRESHOLDS['sound'],
+    ALERT_THRESHOLDS['water'],
+    0.5,  # vibration is 0/1
+    ALERT_THRESHOLDS['temp_high'],
+    ALERT_THRESHOLDS['humidity_high'],
+    0.5,  # motion is 0/1
+])
+ALERT_LO = np.array([
+    -np.inf, -np.inf, -np.inf, -np.inf,
+    ALERT_THRESHOLDS['temp_low'],
+    ALERT_THRESHOLDS['humidity_low'],
+    -np.inf,
+])
+ALERT_HIGH_FMT = ("HIGH GAS: {}", "HIGH SOUND: {}", "HIGH WATER: {}", "VIBRATION DETECTED",
+                  "HIGH TEMP: {}°C", "HIGH HUMIDITY: {}%", "MOTION DETECTED")
+ALERT_LOW_FMT = (None, None, None, None, "LOW TEMP: {}°C", "LOW HUMIDITY: {}%", None)
+
 # ====== GLOBAL STATE ======
-maxlen = WINDOW_SEC
-ts = deque(maxlen=maxlen)
-gas = deque(maxlen=maxlen)
-snd = deque(maxlen=maxlen)
-wtr = deque(maxlen=maxlen)
-tmpC = deque(maxlen=maxlen)
-hum = deque(maxlen=maxlen)
-mot = deque(maxlen=maxlen)
-vib = deque(maxlen=maxlen)
+# Struct-of-arrays ring buffer: one fixed-size column per field, sharing a
+# single write cursor. write_idx is the next slot to overwrite and count the
+# number of valid samples (<= N).
+N = WINDOW_SEC
+sensors = {
+    "ts": np.zeros(N, dtype=np.float64),
+    "gas": np.zeros(N, dtype=np.float32),
+    "snd": np.zeros(N, dtype=np.float32),
+    "wtr": np.zeros(N, dtype=np.float32),
+    "tmpC": np.full(N, np.nan, dtype=np.float32),
+    "hum": np.full(N, np.nan, dtype=np.float32),
+    "mot": np.zeros(N, dtype=np.float32),
+    "vib": np.zeros(N, dtype=np.float32),
+}
+write_idx = 0
+count = 0
+buf_lock = threading.Lock()
 
 start_time = time.time()
 last_email = 0.0
-alert_history = []
-
-def check_alerts(payload: dict) -> list:
-    """Check sensor data against all thresholds and return triggered alerts"""
+# (sent at epoch seconds, alerts, readings in ALERT_KEYS order) per sent email
+alert_history = deque(maxlen=ALERT_HISTORY_LEN)
+last_readings = None
+last_alerts = ([], {})
+smtp_conn = None
+smtp_last_used = 0.0
+last_alert_key = None
+last_alert_time = 0.0
+mail_template = None
+
+def check_alerts(*payloads: dict) -> tuple[list, dict]:
+    """Check samples against all thresholds; return alerts and the readings behind them"""
+    global last_readings, last_alerts
+    # Steady-state samples repeat the previous readings; reuse that result
+    readings = tuple(tuple(p.get(k) for k in ALERT_KEYS) for p in payloads)
+    if readings == last_readings:
+        return last_alerts
+
+    v = np.array(readings, dtype=np.float64)  # (samples, lanes)
+    high = v > ALERT_HI
+    low = v < ALERT_LO
     alerts = []
-
-    if payload.get('gas', 0) > ALERT_THRESHOLDS['gas']:
-        alerts.append(f"HIGH GAS: {payload['gas']}")
-
-    if payload.get('sound', 0) > ALERT_THRESHOLDS['sound']:
-        alerts.append(f"HIGH SOUND: {payload['sound']}")
-
-    if payload.get('water', 0) > ALERT_THRESHOLDS['water']:
-        alerts.append(f"HIGH WATER: {payload['water']}")
-
-    if payload.get('vibration', 0) == 1:
-        alerts.append("VIBRATION DETECTED")
-
-    temp = payload.get('temp')
-    if temp is not None:
-        if temp > ALERT_THRESHOLDS['temp_high']:
-            alerts.append(f"HIGH TEMP: {temp}°C")
-        elif temp < ALERT_THRESHOLDS['temp_low']:
-            alerts.append(f"LOW TEMP: {temp}°C")
-
-    humidity = payload.get('humidity')
-    if humidity is not None:
-        if humidity > ALERT_THRESHOLDS['humidity_high']:
-            alerts.append(f"HIGH HUMIDITY: {humidity}%")
-        elif humidity < ALERT_THRESHOLDS['humidity_low']:
-            alerts.append(f"LOW HUMIDITY: {humidity}%")
-
-    if payload.get('motion', 0) == 1:
-        alerts.append("MOTION DETECTED")
-
-    return alerts
-
-def send_mail(payload: dict, alerts: list):
-    """Send email with detailed alert information"""
-    if not FROM_EMAIL or not APP_PASS:
+    # Report the latest sample, except that each triggered lane shows the
+    # most extreme reading in the batch, which is also what its alert quotes
+    reported = dict(payloads[-1])
+    for i in np.flatnonzero(high.any(axis=0) | low.any(axis=0)):
+        key = ALERT_KEYS[i]
+        if high[:, i].any():
+            reported[key] = payloads[np.nanargmax(v[:, i])][key]
+            alerts.append(ALERT_HIGH_FMT[i].format(reported[key]))
+        if low[:, i].any():
+            value = payloads[np.nanargmin(v[:, i])][key]
+            alerts.append(ALERT_LOW_FMT[i].format(value))
+            if not high[:, i].any():
+                reported[key] = value
+    last_readings, last_alerts = readings, (alerts, reported)
+    return alerts, reported
+
+def close_smtp():
+    """Drop the cached SMTP connection, if any"""
+    global smtp_conn
+    if smtp_conn is None:
         return
+    try:
+        smtp_conn.quit()
+    except Exception:
+        smtp_conn.close()
+    smtp_conn = None
+
+def get_smtp() -> smtplib.SMTP:
+    """Return a logged-in SMTP connection, reusing the cached one while alive"""
+    global smtp_conn, smtp_last_used
+    if smtp_conn is not None and time.time() - smtp_last_used < SMTP_IDLE_S:
+        try:
+            if smtp_conn.noop()[0] == 250:
+                return smtp_conn
+        except (smtplib.SMTPException, OSError):
+            pass
+    close_smtp()
+
+    ctx = ssl.create_default_context(cafile=certifi.where())
+    s = smtplib.SMTP("smtp.gmail.com", 587, timeout=20)
+    try:
+        s.ehlo()
+        s.starttls(context=ctx)
+        s.ehlo()
+        s.login(FROM_EMAIL, APP_PASS)
+    except Exception:
+        s.close()
+        raise
+    smtp_conn = s
+    smtp_last_used = time.time()
+    return s
+
+def get_mail_template() -> MIMEText:
+    """Return the cached alert message, built with its fixed headers on first use"""
+    global mail_template
+    if mail_template is None:
+        msg = MIMEText("", "plain", "utf-8")
+        msg["Subject"] = ""
+        msg["From"] = FROM_EMAIL
+        msg["To"] = TO_EMAIL
+        mail_template = msg
+    return mail_template
+
+def send_mail(payload: dict, alerts: list) -> bool:
+    """Send email with detailed alert information; return True if it was sent"""
+    global smtp_last_used, last_alert_key, last_alert_time
+    if not FROM_EMAIL or not APP_PASS:
+        return False
+
+    # Skip repeats of the last sent alert set before building anything
+    alert_key = tuple(sorted(alerts))
+    if alert_key == last_alert_key and time.time() - last_alert_time < COOLDOWN_S * 5:
+        print("[MAIL] Duplicate alert suppressed")
+        return False
 
     if any("GAS" in alert or "VIBRATION" in alert for alert in alerts):
         subject = "CRITICAL ALERT - Multiple Sensors Triggered!"
@@ -104,7 +192,7 @@ Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 TRIGGERED ALERTS:
 {chr(10).join(f"- {alert}" for alert in alerts)}
 
-CURRENT SENSOR READINGS:
+SENSOR READINGS (alerting value per triggered sensor, latest otherwise):
 - Gas:        {payload.get('gas', 'N/A')}
 - Sound:      {payload.get('sound', 'N/A')} 
 - Water:      {payload.get('water', 'N/A')}
@@ -117,27 +205,27 @@ System Status: Active
 Cooldown: {COOLDOWN_S} seconds
 """
 
-    msg = MIMEText(body)
-    msg["Subject"] = subject
-    msg["From"] = FROM_EMAIL
-    msg["To"] = TO_EMAIL
+    msg = get_mail_template()
+    msg.set_payload(body, "utf-8")
+    msg.replace_header("Subject", subject)
 
     try:
-        ctx = ssl.create_default_context(cafile=certifi.where())
-        with smtplib.SMTP("smtp.gmail.com", 587, timeout=20) as s:
-            s.ehlo()
-            s.starttls(context=ctx)
-            s.ehlo()
-            s.login(FROM_EMAIL, APP_PASS)
-            s.send_message(msg)
+        try:
+            get_smtp().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Server dropped the cached session between NOOP and send; retry once
+            close_smtp()
+            get_smtp().send_message(msg)
+        smtp_last_used = time.time()
+        last_alert_key, last_alert_time = alert_key, smtp_last_used
         print(f"[MAIL] Alert email sent: {subject}")
-        alert_history.append({
-            'timestamp': datetime.now(),
-            'alerts': alerts,
-            'payload': payload
-        })
+        alert_history.append((smtp_last_used, tuple(alerts),
+                              tuple(payload.get(k) for k in ALERT_KEYS)))
+        return True
     except Exception as e:
+        close_smtp()
         print(f"[MAIL] Error sending email: {e}")
+        return False
 
 def open_serial_blocking() -> serial.Serial:
     """Open serial connection with retry logic"""
@@ -150,81 +238,135 @@ def open_serial_blocking() -> serial.Serial:
             print(f"[SERIAL] Port not ready ({e}); retrying in 3s...")
             time.sleep(3)
 
-def parse_json_line(text: str) -> dict | None:
-    """Parse JSON line from Arduino, handling NaN values"""
-    t = text.strip()
-    if not t or t[0] != "{":
+format_data = "[DATA] G:{:3.0f} S:{:3.0f} W:{:3.0f} V:{:1.0f} T:{:4.1f} H:{:3.0f} M:{:1.0f}".format
+
+def parse_json_object(raw) -> dict | None:
+    """Parse one JSON object (any bytes-like) from Arduino, handling NaN values"""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        pass
+    # Arduino prints NaN as a bare `nan`; only copy the object when it has one
+    t = bytes(raw)
+    if t.find(b"nan") == -1:
         return None
-    t = t.replace("nan", "null")
     try:
-        return json.loads(t)
-    except json.JSONDecodeError:
+        return orjson.loads(t.replace(b"nan", b"null"))
+    except orjson.JSONDecodeError:
         return None
 
+def log_raw(raw: bytearray):
+    """Print non-JSON serial output, if it is more than whitespace"""
+    text = raw.decode(errors="ignore").strip()
+    if text:
+        print("[SERIAL RAW]", text)
+
+def read_objects(buf: bytearray):
+    """Yield and consume every complete JSON object accumulated in buf"""
+    # Frame on braces rather than newlines so concatenated or unterminated
+    # lines still parse, and decode each object in place via a memoryview
+    while (end := buf.find(b"}")) != -1:
+        # Payloads are flat, so the nearest "{" before "}" opens the object
+        start = buf.rfind(b"{", 0, end)
+        data = None
+        if start != -1:
+            with memoryview(buf) as mv:
+                data = parse_json_object(mv[start:end + 1])
+        if not data:
+            log_raw(buf[:end + 1])
+        elif start:
+            log_raw(buf[:start])
+        del buf[:end + 1]
+        if data:
+            yield data
+    if len(buf) > MAX_SERIAL_BUF:
+        # No object end in sight; don't let stray output grow buf forever
+        log_raw(buf)
+        buf.clear()
+
+def sample_values(data: dict) -> tuple:
+    """Readings of one payload in sensors column order, minus the timestamp"""
+    # orjson yields native int/float; missing or null temperature and humidity
+    # stay None and become NaN when stored as float
+    return (data.get("gas") or 0, data.get("sound") or 0, data.get("water") or 0,
+            data.get("temp"), data.get("humidity"),
+            data.get("motion") or 0, data.get("vibration") or 0)
+
+def serial_fd(ser: serial.Serial) -> int | None:
+    """Return a select()-able descriptor for the port, or None where unsupported"""
+    # Windows ports have no fileno() and select() only takes sockets there
+    if os.name == "nt":
+        return None
+    try:
+        return ser.fileno()
+    except (AttributeError, OSError):
+        return None
+
+def ordered(buf: np.ndarray, idx: int, n: int) -> np.ndarray:
+    """Return a copy of the valid part of a ring buffer, oldest sample first"""
+    return np.concatenate((buf[idx:n], buf[:idx]))
+
 def reader_thread():
     """Main thread for reading Arduino data and triggering alerts"""
-    global last_email
+    global last_email, write_idx, count
     ser = open_serial_blocking()
-    buf = b""
+    fd = serial_fd(ser)
+    buf = bytearray()
+    last_print = 0.0
 
     print(f"[ALERTS] Alert system active with thresholds: {ALERT_THRESHOLDS}")
 
     while True:
         try:
-            chunk = ser.read(256)
-            if chunk:
-                buf += chunk
-                while b"\n" in buf:
-                    raw, buf = buf.split(b"\n", 1)
-                    text = raw.decode(errors="ignore").strip()
-                    if not text:
-                        continue
-
-                    data = parse_json_line(text)
-                    if not data:
-                        print("[SERIAL RAW]", text)
-                        continue
-
-                    # Append to buffers
-                    tsec = time.time() - start_time
-                    ts.append(tsec)
-                    gas.append(float(data.get("gas", 0) or 0))
-                    snd.append(float(data.get("sound", 0) or 0))
-                    wtr.append(float(data.get("water", 0) or 0))
-                    vib.append(int(data.get("vibration", 0) or 0))
-                    tc = data.get("temp", None)
-                    hm = data.get("humidity", None)
-                    tmpC.append(float(tc) if tc is not None else None)
-                    hum.append(float(hm) if hm is not None else None)
-                    mv = int(data.get("motion", 0) or 0)
-                    mot.append(mv)
-
-                    # Check all alert conditions
-                    current_alerts = check_alerts(data)
-
-                    # Send email if any alerts and cooldown period has passed
-                    if (current_alerts and
-                            (time.time() - last_email >= COOLDOWN_S) and
-                            FROM_EMAIL and APP_PASS):
-                        try:
-                            send_mail(data, current_alerts)
-                            last_email = time.time()
-                            print(f"[ALERT] Triggered: {', '.join(current_alerts)}")
-                        except Exception as e:
-                            print(f"[MAIL] Error: {e}")
-
-                    # Print sensor readings - vibration as number only
-                    print(f"[DATA] G:{data.get('gas'):3.0f} "
-                          f"S:{data.get('sound'):3.0f} "
-                          f"W:{data.get('water'):3.0f} "
-                          f"V:{data.get('vibration', 0):1.0f} "
-                          f"T:{data.get('temp', 0):4.1f} "
-                          f"H:{data.get('humidity', 0):3.0f} "
-                          f"M:{data.get('motion', 0):1.0f}")
-
-            else:
-                time.sleep(0.02)
-        except SerialException as e:
+            # Sleep in the kernel until the port has data, then take everything
+            # already queued in one read; without a descriptor, fall back to a
+            # read that blocks for up to READ_TIMEOUT
+            if fd is not None:
+                ready, _, _ = select.select([fd], [], [], READ_TIMEOUT)
+                if not ready:
+                    continue
+            chunk = ser.read(ser.in_waiting or 256)
+            if not chunk:
+                continue
+            buf.extend(chunk)
+            batch = list(read_objects(buf))[-N:]
+            if not batch:
+                continue
+
+            # Write the whole batch to the ring buffers, one indexed store per column
+            tsec = time.time() - start_time
+            rows = np.array([(tsec, *sample_values(data)) for data in batch], dtype=np.float64)
+            with buf_lock:
+                slots = (write_idx + np.arange(len(rows))) % N
+                for j, col in enumerate(sensors.values()):
+                    col[slots] = rows[:, j]
+                write_idx = (write_idx + len(rows)) % N
+                count = min(count + len(rows), N)
+
+            # Check all alert conditions across the batch
+            current_alerts, alert_readings = check_alerts(*batch)
+
+            # Send at most one email per batch if the cooldown period has passed
+            if (current_alerts and
+                    (time.time() - last_email >= COOLDOWN_S) and
+                    FROM_EMAIL and APP_PASS):
+                try:
+                    # Suppressed and failed sends still start a new cooldown
+                    sent = send_mail(alert_readings, current_alerts)
+                    last_email = time.time()
+                    if sent:
+                        print(f"[ALERT] Triggered: {', '.join(current_alerts)}")
+                except Exception as e:
+                    print(f"[MAIL] Error: {e}")
+
+            # Print latest sensor readings - vibration as number only, at most
+            # once per PRINT_PERIOD_S so stdout never throttles the reader
+            now = time.time()
+            if now - last_print >= PRINT_PERIOD_S:
+                _, g, snd, w, t, h, m, v = rows[-1]
+                print(format_data(g, snd, w, v, t, h, m))
+                last_print = now
+        except OSError as e:  # includes SerialException
             print(f"[SERIAL] Lost connection ({e}); reopening...")
             try:
                 ser.close()
@@ -232,111 +374,132 @@ def reader_thread():
                 pass
             time.sleep(2)
             ser = open_serial_blocking()
+            fd = serial_fd(ser)
+            buf.clear()
         except Exception as e:
             print(f"[SERIAL] Unexpected error: {e}")
 
 # ====== PLOTTING ======
-plt.style.use("dark_background")
-fig = plt.figure(figsize=(14, 10), constrained_layout=True)
-gs = fig.add_gridspec(3, 2)
+app = pg.mkQApp("Arduino Sensor Monitor")
+win = pg.GraphicsLayoutWidget(title="Arduino Sensor Monitor", size=(1400, 1000))
+
+def add_threshold(ax, y: float, color: str):
+    """Draw a dashed horizontal alert threshold line on ax"""
+    c = pg.mkColor(color)
+    c.setAlphaF(0.7)
+    ax.addItem(pg.InfiniteLine(pos=y, angle=0, pen=pg.mkPen(c, style=QtCore.Qt.PenStyle.DashLine)))
+
+def add_curve(ax, color: str, name: str):
+    """Add a live curve to ax; NaN samples leave gaps"""
+    return ax.plot(pen=pg.mkPen(color, width=2), name=name, connect="finite")
 
 # Create subplots
-ax1 = fig.add_subplot(gs[0, :])  # Gas, Sound, Water
-ax2 = fig.add_subplot(gs[1, 0])  # Temperature
-ax3 = fig.add_subplot(gs[1, 1])  # Humidity
-ax4 = fig.add_subplot(gs[2, :])  # Motion + Vibration
+ax1 = win.addPlot(row=0, col=0, colspan=2)  # Gas, Sound, Water
+ax2 = win.addPlot(row=1, col=0)  # Temperature
+ax3 = win.addPlot(row=1, col=1)  # Humidity
+ax4 = win.addPlot(row=2, col=0, colspan=2)  # Motion + Vibration
+for ax in (ax1, ax2, ax3, ax4):
+    ax.addLegend()
+    ax.showGrid(x=True, y=True, alpha=0.3)
+    ax.setLabel("bottom", "Time (s)")
 
 # Plot 1: Combined sensors
-gas_line, = ax1.plot([], [], 'r-', label="Gas", linewidth=2)
-snd_line, = ax1.plot([], [], 'y-', label="Sound", linewidth=2)
-wtr_line, = ax1.plot([], [], 'c-', label="Water", linewidth=2)
-ax1.set_title("Gas / Sound / Water")
-ax1.set_xlabel("Time (s)")
-ax1.set_ylabel("Sensor Values")
-ax1.legend()
-ax1.grid(True, alpha=0.3)
+gas_line = add_curve(ax1, "r", "Gas")
+snd_line = add_curve(ax1, "y", "Sound")
+wtr_line = add_curve(ax1, "c", "Water")
+ax1.setTitle("Gas / Sound / Water")
+ax1.setLabel("left", "Sensor Values")
 
 # Add threshold lines
-ax1.axhline(y=ALERT_THRESHOLDS['gas'], color='r', linestyle='--', alpha=0.7)
-ax1.axhline(y=ALERT_THRESHOLDS['sound'], color='y', linestyle='--', alpha=0.7)
-ax1.axhline(y=ALERT_THRESHOLDS['water'], color='c', linestyle='--', alpha=0.7)
+add_threshold(ax1, ALERT_THRESHOLDS['gas'], "r")
+add_threshold(ax1, ALERT_THRESHOLDS['sound'], "y")
+add_threshold(ax1, ALERT_THRESHOLDS['water'], "c")
 
 # Plot 2: Temperature
-temp_line, = ax2.plot([], [], 'orange', label="Temperature", linewidth=2)
-ax2.set_title("Temperature")
-ax2.set_xlabel("Time (s)")
-ax2.set_ylabel("°C")
-ax2.legend()
-ax2.grid(True, alpha=0.3)
-ax2.axhline(y=ALERT_THRESHOLDS['temp_high'], color='red', linestyle='--', alpha=0.7)
-ax2.axhline(y=ALERT_THRESHOLDS['temp_low'], color='blue', linestyle='--', alpha=0.7)
+temp_line = add_curve(ax2, "#ffa500", "Temperature")
+ax2.setTitle("Temperature")
+ax2.setLabel("left", "°C")
+add_threshold(ax2, ALERT_THRESHOLDS['temp_high'], "r")
+add_threshold(ax2, ALERT_THRESHOLDS['temp_low'], "b")
 
 # Plot 3: Humidity
-hum_line, = ax3.plot([], [], 'b', label="Humidity", linewidth=2)
-ax3.set_title("Humidity")
-ax3.set_xlabel("Time (s)")
-ax3.set_ylabel("%")
-ax3.legend()
-ax3.grid(True, alpha=0.3)
-ax3.axhline(y=ALERT_THRESHOLDS['humidity_high'], color='red', linestyle='--', alpha=0.7)
-ax3.axhline(y=ALERT_THRESHOLDS['humidity_low'], color='blue', linestyle='--', alpha=0.7)
+hum_line = add_curve(ax3, "b", "Humidity")
+ax3.setTitle("Humidity")
+ax3.setLabel("left", "%")
+add_threshold(ax3, ALERT_THRESHOLDS['humidity_high'], "r")
+add_threshold(ax3, ALERT_THRESHOLDS['humidity_low'], "b")
 
 # Plot 4: Motion + Vibration
-mot_line, = ax4.plot([], [], 'g-', label="Motion", linewidth=2)
-vib_line, = ax4.plot([], [], 'm-', label="Vibration", linewidth=2)
-ax4.set_title("Motion & Vibration Events")
-ax4.set_xlabel("Time (s)")
-ax4.set_ylabel("State (0/1)")
-ax4.legend()
-ax4.set_ylim(-0.1, 1.1)
-ax4.grid(True, alpha=0.3)
-
-def update(_):
+mot_line = add_curve(ax4, "g", "Motion")
+vib_line = add_curve(ax4, "m", "Vibration")
+ax4.setTitle("Motion & Vibration Events")
+ax4.setLabel("left", "State (0/1)")
+ax4.setYRange(-0.1, 1.1, padding=0)
+
+last_plotted = None
+
+def decimate_events(y: np.ndarray, stride: int) -> np.ndarray:
+    """Downsample a 0/1 event series, keeping any event inside each stride"""
+    if stride == 1:
+        return y
+    return np.maximum.reduceat(y, np.arange(0, len(y), stride))
+
+def update():
     """Update all plots with new data"""
-    if not ts:
-        return gas_line, snd_line, wtr_line, temp_line, hum_line, mot_line, vib_line
+    global last_plotted
+    with buf_lock:
+        n, idx = count, write_idx
+        if not n:
+            return
+        cols = {key: ordered(col, idx, n) for key, col in sensors.items()}
+
+    x = cols["ts"]
+    current_time = float(x[-1])
+    if current_time == last_plotted:
+        # No new sample since the last tick
+        return
+    last_plotted = current_time
+
+    y_gas, y_snd, y_wtr = cols["gas"], cols["snd"], cols["wtr"]
+    y_temp, y_hum = cols["tmpC"], cols["hum"]
+    y_mot, y_vib = cols["mot"], cols["vib"]
+    x_lo, x_hi = max(0, current_time - WINDOW_SEC), current_time + 1
 
-    x = list(ts)
-    current_time = x[-1] if x else 0
+    # Never hand the renderer more points than MAX_PLOT_POINTS; ranges below
+    # are still computed from the full-resolution data
+    stride = -(-n // MAX_PLOT_POINTS)
+    xs = x[::stride]
 
     # Update combined sensors plot
-    gas_line.set_data(x, list(gas))
-    snd_line.set_data(x, list(snd))
-    wtr_line.set_data(x, list(wtr))
+    gas_line.setData(xs, y_gas[::stride])
+    snd_line.setData(xs, y_snd[::stride])
+    wtr_line.setData(xs, y_wtr[::stride])
 
     # Auto-scale combined plot
-    all_vals = list(gas) + list(snd) + list(wtr)
-    if all_vals:
-        y_min = min(all_vals)
-        y_max = max(all_vals)
-        padding = max(10, (y_max - y_min) * 0.1)
-        ax1.set_ylim(y_min - padding, y_max + padding)
-        ax1.set_xlim(max(0, current_time - WINDOW_SEC), current_time + 1)
+    y_min = float(min(y_gas.min(), y_snd.min(), y_wtr.min()))
+    y_max = float(max(y_gas.max(), y_snd.max(), y_wtr.max()))
+    padding = max(10, (y_max - y_min) * 0.1)
+    ax1.setYRange(y_min - padding, y_max + padding, padding=0)
+    ax1.setXRange(x_lo, x_hi, padding=0)
 
     # Update temperature plot
-    y_temp = [v if v is not None else float("nan") for v in tmpC]
-    temp_line.set_data(x, y_temp)
-    if any(v == v for v in y_temp):
-        valid_temp = [v for v in y_temp if v == v]
-        if valid_temp:
-            ax2.set_ylim(min(valid_temp) - 2, max(valid_temp) + 2)
-    ax2.set_xlim(max(0, current_time - WINDOW_SEC), current_time + 1)
+    temp_line.setData(xs, y_temp[::stride])
+    if np.isfinite(y_temp).any():
+        lo, hi = float(np.nanmin(y_temp)), float(np.nanmax(y_temp))
+        ax2.setYRange(lo - 2, hi + 2, padding=0)
+    ax2.setXRange(x_lo, x_hi, padding=0)
 
     # Update humidity plot
-    y_hum = [v if v is not None else float("nan") for v in hum]
-    hum_line.set_data(x, y_hum)
-    if any(v == v for v in y_hum):
-        valid_hum = [v for v in y_hum if v == v]
-        if valid_hum:
-            ax3.set_ylim(max(0, min(valid_hum) - 5), min(100, max(valid_hum) + 5))
-    ax3.set_xlim(max(0, current_time - WINDOW_SEC), current_time + 1)
+    hum_line.setData(xs, y_hum[::stride])
+    if np.isfinite(y_hum).any():
+        lo, hi = float(np.nanmin(y_hum)), float(np.nanmax(y_hum))
+        ax3.setYRange(max(0, lo - 5), min(100, hi + 5), padding=0)
+    ax3.setXRange(x_lo, x_hi, padding=0)
 
     # Update events plot
-    mot_line.set_data(x, list(mot))
-    vib_line.set_data(x, list(vib))
-    ax4.set_xlim(max(0, current_time - WINDOW_SEC), current_time + 1)
-
-    return gas_line, snd_line, wtr_line, temp_line, hum_line, mot_line, vib_line
+    mot_line.setData(xs, decimate_events(y_mot, stride))
+    vib_line.setData(xs, decimate_events(y_vib, stride))
+    ax4.setXRange(x_lo, x_hi, padding=0)
 
 def main():
     """Main function to start the monitoring system"""
@@ -349,12 +512,18 @@ def main():
     # Start serial reader thread
     threading.Thread(target=reader_thread, daemon=True).start()
 
-    # Start animation
-    ani = FuncAnimation(fig, update, interval=1000, cache_frame_data=False, save_count=300)
+    # Refresh plots once per second
+    timer = QtCore.QTimer()
+    timer.timeout.connect(update)
+    timer.start(1000)
+
+    # Qt's C event loop swallows KeyboardInterrupt; quit the loop on SIGINT
+    # instead (the timer above regularly hands control back to Python)
+    signal.signal(signal.SIGINT, lambda *_: app.quit())
 
     try:
-        plt.show()
-    except KeyboardInterrupt:
+        win.show()
+        pg.exec()
         print("Monitoring stopped")
     except Exception as e:
         print(f"Error: {e}")